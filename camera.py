@@ -0,0 +1,70 @@
+"""Background webcam capture so frame I/O overlaps with detection and rendering."""
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+class CameraThread:
+    """Reads frames on a worker thread and hands out the newest one.
+
+    Frames rotate through three buffers: one being filled by the camera, one
+    holding the newest complete frame, and one owned by the consumer. A frame
+    returned by `read` stays valid until the next call.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture) -> None:
+        self.cap = cap
+        self._cond = threading.Condition()
+        self._back: Optional[np.ndarray] = None
+        self._middle: Optional[np.ndarray] = None
+        self._front: Optional[np.ndarray] = None
+        self._fresh = False
+        self._running = False
+        self._thread = threading.Thread(target=self._run, name="camera", daemon=True)
+
+    def start(self) -> CameraThread:
+        """Begin capturing on the worker thread."""
+        self._running = True
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop capturing and wait for the worker thread to exit."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def read(self) -> Optional[np.ndarray]:
+        """Wait for a frame newer than the last one read, or None once the stream ends."""
+        with self._cond:
+            while not self._fresh and self._running:
+                self._cond.wait()
+            if not self._fresh:
+                return None
+            self._front, self._middle = self._middle, self._front
+            self._fresh = False
+            return self._front
+
+    def _run(self) -> None:
+        try:
+            while self._running:
+                ok, frame = self.cap.read(self._back)
+                if not ok:
+                    break
+                with self._cond:
+                    # Publish the new frame; any unread frame becomes the next write target.
+                    self._back, self._middle = self._middle, frame
+                    self._fresh = True
+                    self._cond.notify_all()
+        finally:
+            # However the loop ends, including a read error, wake the reader so
+            # it sees the end of the stream instead of waiting forever.
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
@@ -1,7 +1,7 @@
 """Canvas abstraction to accumulate brush strokes."""
 from __future__ import annotations
 
-from typing import Tuple
+from typing import List, Tuple
 
 import cv2
 import numpy as np
@@ -9,9 +9,12 @@ import numpy as np
 Point = Tuple[int, int]
 Color = Tuple[int, int, int]
 
+# Points are appended to the active stroke in blocks of this many.
+_STROKE_CHUNK = 256
+
 
 class DrawingCanvas:
-    """Stores a persistent drawing surface that matches the camera feed."""
+    """Stores strokes as polylines sized to the camera feed and rasterizes them on demand."""
 
     def __init__(
         self,
@@ -22,28 +25,64 @@ class DrawingCanvas:
     ) -> None:
         self.line_color = line_color
         self.thickness = thickness
-        self._init_surface(width, height)
+        self._init_strokes(width, height)
 
-    def _init_surface(self, width: int, height: int) -> None:
+    def _init_strokes(self, width: int, height: int) -> None:
         self.width = width
         self.height = height
-        self.surface = np.zeros((height, width, 3), dtype=np.uint8)
+        # Finished strokes as (N, 2) int32 point arrays; memory grows with ink,
+        # not with canvas area.
+        self.strokes: List[np.ndarray] = []
+        self._current = np.empty((_STROKE_CHUNK, 2), dtype=np.int32)
+        self._count = 0
 
     def resize_if_needed(self, width: int, height: int) -> None:
         """Ensure the canvas matches the latest frame shape."""
         if width != self.width or height != self.height:
-            self._init_surface(width, height)
+            self._init_strokes(width, height)
 
     def draw_line(self, start: Point | None, end: Point | None) -> None:
-        """Draw an anti-aliased stroke between two finger positions."""
+        """Extend the active stroke to `end`, starting a new one unless it already ends at `start`."""
         if start is None or end is None:
             return
-        cv2.line(self.surface, start, end, self.line_color, self.thickness, cv2.LINE_AA)
+        last = tuple(self._current[self._count - 1]) if self._count else None
+        if last is not None and last == tuple(start):
+            if last == tuple(end):
+                # A resting finger or a repeated detection result adds no ink.
+                return
+        else:
+            self._finish_stroke()
+            self._append(start)
+        self._append(end)
+
+    def _append(self, point: Point) -> None:
+        if self._count == len(self._current):
+            grown = np.empty((self._count + _STROKE_CHUNK, 2), dtype=np.int32)
+            grown[: self._count] = self._current
+            self._current = grown
+        self._current[self._count] = point
+        self._count += 1
+
+    def _finish_stroke(self) -> None:
+        if self._count:
+            self.strokes.append(self._current[: self._count].copy())
+            self._count = 0
 
     def clear(self) -> None:
         """Clear the canvas while preserving settings."""
-        self.surface.fill(0)
+        self.strokes.clear()
+        self._count = 0
+
+    def render_into(self, frame: np.ndarray) -> None:
+        """Rasterize every stroke directly onto the frame."""
+        polylines = self.strokes
+        if self._count:
+            polylines = polylines + [self._current[: self._count]]
+        if polylines:
+            cv2.polylines(frame, polylines, False, self.line_color, self.thickness, cv2.LINE_8)
 
     def get_image(self) -> np.ndarray:
-        """Expose the raw canvas image for rendering."""
-        return self.surface
+        """Rasterize the strokes onto a blank image the size of the canvas."""
+        image = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        self.render_into(image)
+        return image
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import threading
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, Any, List
 
@@ -23,6 +24,26 @@ RING_FINGER_PIP = 14
 PINKY_TIP = 20
 PINKY_PIP = 18
 
+FINGER_NAMES = ("index", "middle", "ring", "pinky")
+_FINGER_TIPS = np.array([INDEX_FINGER_TIP, MIDDLE_FINGER_TIP, RING_FINGER_TIP, PINKY_TIP])
+_FINGER_PIPS = np.array([INDEX_FINGER_PIP, MIDDLE_FINGER_PIP, RING_FINGER_PIP, PINKY_PIP])
+
+# Finger mask bits, most significant first: index, middle, ring, pinky.
+_FINGER_BIT_VALUES = (8, 4, 2, 1)
+_FINGER_BITS = np.array(_FINGER_BIT_VALUES)
+_MASK_FIST = 0b0000
+_MASK_DRAW = 0b1000
+_MASK_PALM = 0b1111
+
+# Gesture label for every possible finger mask.
+_GESTURE_TABLE = tuple(
+    "fist" if mask == _MASK_FIST
+    else "draw" if mask == _MASK_DRAW
+    else "clear" if mask == _MASK_PALM
+    else "idle"
+    for mask in range(16)
+)
+
 HAND_CONNECTIONS = [
     (0, 1), (1, 2), (2, 3), (3, 4),
     (0, 5), (5, 6), (6, 7), (7, 8),
@@ -36,8 +57,15 @@ HAND_CONNECTIONS = [
 class GestureResult:
     gesture: str
     cursor: Optional[Point]
-    landmarks: Optional[Any] # List[NormalizedLandmark]
-    finger_states: Dict[str, bool]
+    landmarks: Optional[np.ndarray] # (21, 3) normalized x, y, z
+    points: Optional[np.ndarray] # (21, 2) int32 pixel coordinates
+    finger_mask: int # extended fingers, index/middle/ring/pinky from bit 3 to 0
+    timestamp_ms: int # timestamp of the frame it was detected on; -1 before any result
+
+    @property
+    def finger_states(self) -> Dict[str, bool]:
+        """Name each finger and whether it is extended."""
+        return {name: bool(self.finger_mask & bit) for name, bit in zip(FINGER_NAMES, _FINGER_BIT_VALUES)}
 
 
 class GestureDetector:
@@ -48,96 +76,174 @@ class GestureDetector:
         max_num_hands: int = 1,
         detection_confidence: float = 0.7,
         tracking_confidence: float = 0.5,
+        infer_width: int = 320,
+        use_gpu: bool = False,
+        num_workers: int = 1,
+        use_opencl: bool = False,
     ) -> None:
         model_path = os.path.join(os.path.dirname(__file__), 'hand_landmarker.task')
         if not os.path.exists(model_path):
              raise RuntimeError(f"Model not found at {model_path}. Please download hand_landmarker.task")
              
-        base_options = python.BaseOptions(model_asset_path=model_path)
-        options = vision.HandLandmarkerOptions(
-            base_options=base_options,
-            num_hands=max_num_hands,
-            min_hand_detection_confidence=detection_confidence,
-            min_hand_presence_confidence=tracking_confidence,
-            min_tracking_confidence=tracking_confidence
-        )
-        self.landmarker = vision.HandLandmarker.create_from_options(options)
+        self._lock = threading.Lock()
+        self._latest: Optional[GestureResult] = None
+        self._latest_ts = -1
+        self._frame_size: Tuple[int, int] = (0, 0)
+        self.infer_width = infer_width
+        self._small: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
+        # Run the resize and color conversion through OpenCV's T-API when an
+        # OpenCL device is present; only the small RGB image is downloaded.
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        self._conn = np.asarray(HAND_CONNECTIONS, dtype=np.int32)
+
+        delegates = [python.BaseOptions.Delegate.CPU]
+        if use_gpu:
+            delegates.insert(0, python.BaseOptions.Delegate.GPU)
+        for delegate in delegates:
+            options = vision.HandLandmarkerOptions(
+                base_options=python.BaseOptions(model_asset_path=model_path, delegate=delegate),
+                num_hands=max_num_hands,
+                min_hand_detection_confidence=detection_confidence,
+                min_hand_presence_confidence=tracking_confidence,
+                min_tracking_confidence=tracking_confidence,
+                running_mode=vision.RunningMode.LIVE_STREAM,
+                result_callback=self._on_result,
+            )
+            try:
+                landmarker = vision.HandLandmarker.create_from_options(options)
+                break
+            except (RuntimeError, NotImplementedError):
+                # The GPU delegate is unavailable on some platforms; fall back to
+                # the CPU (XNNPACK) delegate.
+                if delegate == delegates[-1]:
+                    raise
+        self.delegate = delegate
+
+        # Extra landmarkers take frames round-robin so several detections can be
+        # in flight at once; each instance still sees increasing timestamps.
+        self.landmarkers = [landmarker]
+        for _ in range(num_workers - 1):
+            self.landmarkers.append(vision.HandLandmarker.create_from_options(options))
+        self._next_worker = 0
 
     def close(self) -> None:
         """Release MediaPipe resources."""
-        self.landmarker.close()
+        for landmarker in self.landmarkers:
+            landmarker.close()
 
-    def process(self, frame: np.ndarray) -> GestureResult:
-        """Run the MediaPipe graph and return gesture metadata."""
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    def submit(self, frame: np.ndarray, timestamp_ms: int) -> None:
+        """Queue a frame for asynchronous landmark detection."""
+        h, w = frame.shape[:2]
+        self._frame_size = (w, h)
+
+        rgb = self._to_rgb(frame)
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
-        
-        result = self.landmarker.detect(mp_image)
-        
+        landmarker = self.landmarkers[self._next_worker]
+        self._next_worker = (self._next_worker + 1) % len(self.landmarkers)
+        landmarker.detect_async(mp_image, timestamp_ms)
+
+    def latest(self) -> GestureResult:
+        """Return the most recent gesture result without blocking."""
+        with self._lock:
+            latest = self._latest
+        if latest is None:
+            return self._build_result(None, *self._frame_size, -1)
+        return latest
+
+    def _on_result(self, result: Any, output_image: mp.Image, timestamp_ms: int) -> None:
+        # Invoked on the MediaPipe worker thread once detect_async finishes.
         # result.hand_landmarks is a list of lists of landmarks (one list per hand)
         landmarks = result.hand_landmarks[0] if result.hand_landmarks else None
-        
+        gesture_result = self._build_result(landmarks, *self._frame_size, timestamp_ms)
+        with self._lock:
+            # With several workers, results can finish out of order; keep the newest.
+            if timestamp_ms > self._latest_ts:
+                self._latest = gesture_result
+                self._latest_ts = timestamp_ms
+
+    def _to_rgb(self, frame: np.ndarray) -> np.ndarray:
+        # Landmarks come back normalized, so inference can run on a smaller
+        # copy while cursor and drawing stay at full resolution.
         h, w = frame.shape[:2]
+        small_size = None
+        if w > self.infer_width:
+            small_size = (self.infer_width, round(h * self.infer_width / w))
+
+        if self.use_opencl:
+            src = cv2.UMat(frame)
+            if small_size is not None:
+                src = cv2.resize(src, small_size, interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(src, cv2.COLOR_BGR2RGB).get()
+
+        src = frame
+        if small_size is not None:
+            small_shape = (small_size[1], small_size[0], frame.shape[2])
+            if self._small is None or self._small.shape != small_shape:
+                self._small = np.empty(small_shape, dtype=frame.dtype)
+            cv2.resize(frame, small_size, dst=self._small, interpolation=cv2.INTER_AREA)
+            src = self._small
+
+        if self._rgb is None or self._rgb.shape != src.shape:
+            self._rgb = np.empty_like(src)
+        # mp.Image copies the pixels, so the conversion buffer can be reused
+        # for the next frame while this one is still being processed.
+        cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        return self._rgb
+
+    def _build_result(
+        self,
+        landmarks: Optional[List[Any]],
+        w: int,
+        h: int,
+        timestamp_ms: int,
+    ) -> GestureResult:
         cursor = None
-        finger_states: Dict[str, bool] = {"index": False, "middle": False, "ring": False, "pinky": False}
+        coords = None
+        points = None
+        finger_mask = 0
 
         if landmarks is not None:
-            cursor = self._landmark_to_point(landmarks, INDEX_FINGER_TIP, w, h)
-            finger_states = self._get_finger_states(landmarks)
-
-        gesture = self._interpret_gesture(finger_states)
-        return GestureResult(gesture=gesture, cursor=cursor, landmarks=landmarks, finger_states=finger_states)
+            # One pass over the MediaPipe landmark objects; everything else
+            # reads from the resulting array.
+            coords = self._to_array(landmarks)
+            points = (coords[:, :2] * np.array([w, h], dtype=np.float32)).astype(np.int32)
+            cursor = tuple(points[INDEX_FINGER_TIP].tolist())
+            finger_mask = self._get_finger_mask(coords[:, 1])
+
+        gesture = _GESTURE_TABLE[finger_mask]
+        return GestureResult(
+            gesture=gesture,
+            cursor=cursor,
+            landmarks=coords,
+            points=points,
+            finger_mask=finger_mask,
+            timestamp_ms=timestamp_ms,
+        )
 
     def draw_hand_annotations(
         self,
         frame: np.ndarray,
-        landmarks: List[Any],
+        points: np.ndarray,
     ) -> None:
         """Overlay the landmark skeleton on the webcam feed."""
-        h, w = frame.shape[:2]
-        # Draw connections
-        for start_idx, end_idx in HAND_CONNECTIONS:
-            start = landmarks[start_idx]
-            end = landmarks[end_idx]
-            cv2.line(frame, 
-                     (int(start.x * w), int(start.y * h)), 
-                     (int(end.x * w), int(end.y * h)), 
-                     (255, 255, 255), 2)
-        
+        # Draw connections as two-point polylines in a single call
+        cv2.polylines(frame, points[self._conn], False, (255, 255, 255), 2)
+
         # Draw points
-        for lm in landmarks:
-            cv2.circle(frame, (int(lm.x * w), int(lm.y * h)), 4, (0, 0, 255), -1)
-
-    def _get_finger_states(self, landmarks: List[Any]) -> Dict[str, bool]:
-        tips = {"index": INDEX_FINGER_TIP, "middle": MIDDLE_FINGER_TIP, "ring": RING_FINGER_TIP, "pinky": PINKY_TIP}
-        pips = {"index": INDEX_FINGER_PIP, "middle": MIDDLE_FINGER_PIP, "ring": RING_FINGER_PIP, "pinky": PINKY_PIP}
-        states: Dict[str, bool] = {}
-        for name in tips:
-            tip = landmarks[tips[name]]
-            pip = landmarks[pips[name]]
-            states[name] = tip.y < pip.y
-        return states
-
-    def _interpret_gesture(self, finger_states: Dict[str, bool]) -> str:
-        idx = finger_states["index"]
-        mid = finger_states["middle"]
-        ring = finger_states["ring"]
-        pinky = finger_states["pinky"]
-
-        if idx and mid and ring and pinky:
-            return "clear"
-        if not idx and not mid and not ring and not pinky:
-            return "fist"
-        if idx and not mid and not ring and not pinky:
-            return "draw"
-        return "idle"
+        for x, y in points.tolist():
+            cv2.circle(frame, (x, y), 4, (0, 0, 255), -1)
+
+    def _get_finger_mask(self, ys: np.ndarray) -> int:
+        extended = ys[_FINGER_TIPS] < ys[_FINGER_PIPS]
+        return int(extended.dot(_FINGER_BITS))
 
     @staticmethod
-    def _landmark_to_point(
-        landmarks: List[Any],
-        index: int,
-        width: int,
-        height: int,
-    ) -> Point:
-        lm = landmarks[index]
-        return int(lm.x * width), int(lm.y * height)
+    def _to_array(landmarks: List[Any]) -> np.ndarray:
+        return np.fromiter(
+            (c for lm in landmarks for c in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=3 * len(landmarks),
+        ).reshape(-1, 3)
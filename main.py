@@ -1,14 +1,17 @@
 """Entry point for the Air Canvas interactive drawing experience."""
 from __future__ import annotations
 
+import argparse
 import sys
+import time
 from typing import Dict
 
 import cv2
 
+from camera import CameraThread
 from canvas import DrawingCanvas
 from gesture_detector import GestureDetector
-from utils import GestureFilter, PointSmoother, blend_frames, draw_cursor, put_multiline_text
+from utils import GestureFilter, PointSmoother, TextSticker, draw_cursor, render_text_sticker, stamp_text_sticker
 
 GESTURE_COLORS: Dict[str, tuple[int, int, int]] = {
     "draw": (0, 255, 0),
@@ -17,40 +20,67 @@ GESTURE_COLORS: Dict[str, tuple[int, int, int]] = {
     "idle": (255, 255, 255),
 }
 
+# Refresh the windows at most this often; faster cameras still feed detection.
+DISPLAY_INTERVAL_S = 1.0 / 60.0
 
-def run() -> None:
+
+def run(
+    debug_canvas: bool = False,
+    use_opencl: bool = False,
+    use_gpu: bool = False,
+    num_workers: int = 1,
+) -> None:
     cap = cv2.VideoCapture(0)
     if not cap.isOpened():
         print("Unable to access the webcam. Make sure a camera is connected.")
         sys.exit(1)
+    # Keep the driver from queueing stale frames behind the capture thread.
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
-    detector = GestureDetector()
+    detector = GestureDetector(num_workers=num_workers, use_gpu=use_gpu, use_opencl=use_opencl)
     canvas: DrawingCanvas | None = None
     prev_point = None
     smoother = PointSmoother(momentum=0.75)
     gesture_filter = GestureFilter(confirm_frames=3, default="idle")
     last_gesture = "idle"
+    last_timestamp_ms = -1
+    last_result_ms = -1
+    cursor = None
+    gesture = "idle"
+    # Status text only changes with the gesture, so rasterize it once per gesture.
+    text_cache: Dict[str, TextSticker] = {}
+    next_display = 0.0
+    camera = CameraThread(cap).start()
 
     try:
         while True:
-            ret, frame = cap.read()
-            if not ret:
+            frame = camera.read()
+            if frame is None:
                 print("Stream ended or cannot read from webcam. Exiting.")
                 break
 
-            frame = cv2.flip(frame, 1)
+            # The capture thread leaves this buffer to us until the next read, so
+            # mirror it in place; it then doubles as the overlay that strokes
+            # and text are composited onto.
+            cv2.flip(frame, 1, dst=frame)
             height, width = frame.shape[:2]
             if canvas is None:
                 canvas = DrawingCanvas(width, height)
             else:
                 canvas.resize_if_needed(width, height)
 
-            result = detector.process(frame)
-            if result.landmarks is not None:
-                detector.draw_hand_annotations(frame, result.landmarks)
+            # detect_async requires strictly increasing timestamps.
+            timestamp_ms = max(int(time.monotonic() * 1000), last_timestamp_ms + 1)
+            detector.submit(frame, timestamp_ms)
+            last_timestamp_ms = timestamp_ms
 
-            cursor = smoother.update(result.cursor)
-            gesture = gesture_filter.update(result.gesture)
+            result = detector.latest()
+            # Inference can span several camera frames; advance the filters once
+            # per detection so one result cannot confirm a gesture on its own.
+            if result.timestamp_ms != last_result_ms:
+                last_result_ms = result.timestamp_ms
+                cursor = smoother.update(result.cursor)
+                gesture = gesture_filter.update(result.gesture)
 
             if gesture == "draw" and cursor is not None:
                 if prev_point is None:
@@ -65,32 +95,74 @@ def run() -> None:
 
             last_gesture = gesture
 
-            overlay = blend_frames(frame, canvas.get_image()) if canvas else frame
-            cursor_color = GESTURE_COLORS.get(gesture, (255, 255, 255))
-            draw_cursor(overlay, cursor, cursor_color)
-            put_multiline_text(
-                overlay,
-                [
-                    f"Gesture: {gesture.upper()}",
-                    "Controls: INDEX=draw, FIST=stop, PALM=clear",
-                    "Press 'q' to quit",
-                ],
-            )
-
-            cv2.imshow("Air Canvas", overlay)
-            if canvas is not None:
-                cv2.imshow("Canvas", canvas.get_image())
-
-            key = cv2.waitKey(1) & 0xFF
+            now = time.monotonic()
+            if now >= next_display:
+                next_display = now + DISPLAY_INTERVAL_S
+                if result.points is not None:
+                    detector.draw_hand_annotations(frame, result.points)
+
+                overlay = frame
+                canvas.render_into(overlay)
+                cursor_color = GESTURE_COLORS.get(gesture, (255, 255, 255))
+                draw_cursor(overlay, cursor, cursor_color)
+                text = text_cache.get(gesture)
+                if text is None:
+                    text = text_cache[gesture] = render_text_sticker(
+                        [
+                            f"Gesture: {gesture.upper()}",
+                            "Controls: INDEX=draw, FIST=stop, PALM=clear",
+                            "Press 'q' to quit",
+                        ]
+                    )
+                stamp_text_sticker(overlay, text)
+
+                cv2.imshow("Air Canvas", overlay)
+                if debug_canvas:
+                    cv2.imshow("Canvas", canvas.get_image())
+
+            key = cv2.pollKey() & 0xFF
             if key == ord("q"):
                 break
     except KeyboardInterrupt:
         pass
     finally:
+        camera.stop()
         cap.release()
         detector.close()
         cv2.destroyAllWindows()
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Draw in the air with hand gestures.")
+    parser.add_argument(
+        "--debug-canvas",
+        action="store_true",
+        help="also show the raw drawing canvas in a separate window",
+    )
+    parser.add_argument(
+        "--opencl",
+        action="store_true",
+        help="resize and color-convert frames for detection through OpenCL when available",
+    )
+    parser.add_argument(
+        "--gpu",
+        action="store_true",
+        help="run hand landmark inference on MediaPipe's GPU delegate, falling back to CPU if it cannot be created",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of hand landmarker instances to run, taking frames in turn (default: 1)",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    run()
+    args = parse_args()
+    run(
+        debug_canvas=args.debug_canvas,
+        use_opencl=args.opencl,
+        use_gpu=args.gpu,
+        num_workers=max(1, args.workers),
+    )
@@ -6,21 +6,16 @@ import numpy as np
 
 Color = Tuple[int, int, int]
 Point = Tuple[int, int]
-
-
-def blend_frames(frame: np.ndarray, canvas: np.ndarray, alpha: float = 0.4) -> np.ndarray:
-    """Overlay the drawing canvas on top of the live frame."""
-    alpha = min(max(alpha, 0.0), 1.0)
-    beta = 1.0 - alpha
-    return cv2.addWeighted(frame, beta, canvas, alpha, 0)
+# Premultiplied ink and inverse coverage, both HxWx3 uint8.
+TextSticker = Tuple[np.ndarray, np.ndarray]
 
 
 def draw_cursor(frame: np.ndarray, position: Point | None, color: Color, radius: int = 12) -> None:
     """Render a visual cursor to show where drawing will occur."""
     if position is None:
         return
-    cv2.circle(frame, position, radius, color, 2, cv2.LINE_AA)
-    cv2.circle(frame, position, max(2, radius // 2), color, -1, cv2.LINE_AA)
+    cv2.circle(frame, position, radius, color, 2, cv2.LINE_8)
+    cv2.circle(frame, position, max(2, radius // 2), color, -1, cv2.LINE_8)
 
 
 def put_multiline_text(
@@ -46,6 +41,40 @@ def put_multiline_text(
         y += line_height
 
 
+def render_text_sticker(
+    lines: Sequence[str],
+    origin: Point = (12, 28),
+    color: Color = (255, 255, 255),
+    line_height: int = 26,
+) -> TextSticker:
+    """Rasterize status text lines once into a sticker anchored at the top-left corner."""
+    x, y = origin
+    width, baseline = 1, 0
+    for line in lines:
+        (text_w, _), baseline = cv2.getTextSize(line, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+        width = max(width, x + text_w + 2)
+    height = y + line_height * max(len(lines) - 1, 0) + baseline + 2
+
+    mask = np.zeros((height, width), dtype=np.uint8)
+    put_multiline_text(mask, lines, origin, (255, 255, 255), line_height)
+
+    # Precompute the blend so stamping is one multiply and one add per frame:
+    # the ink premultiplied by coverage, and the coverage left for the frame.
+    alpha = cv2.merge([mask, mask, mask])
+    ink = (alpha.astype(np.float32) * (np.asarray(color, dtype=np.float32) / 255.0) + 0.5).astype(np.uint8)
+    return ink, 255 - alpha
+
+
+def stamp_text_sticker(frame: np.ndarray, sticker: TextSticker) -> None:
+    """Paint a prerendered text sticker onto the frame's top-left corner."""
+    ink, inv_alpha = sticker
+    h = min(ink.shape[0], frame.shape[0])
+    w = min(ink.shape[1], frame.shape[1])
+    roi = frame[:h, :w]
+    cv2.multiply(roi, inv_alpha[:h, :w], dst=roi, scale=1.0 / 255.0)
+    cv2.add(roi, ink[:h, :w], dst=roi)
+
+
 def ensure_canvas_size(canvas: np.ndarray, width: int, height: int) -> np.ndarray:
     """Return a canvas with the requested shape, reinitializing when needed."""
     if canvas.shape[1] == width and canvas.shape[0] == height:
@@ -56,22 +85,30 @@ def ensure_canvas_size(canvas: np.ndarray, width: int, height: int) -> np.ndarra
 class PointSmoother:
     """Simple exponential moving average to reduce cursor jitter."""
 
+    # State is kept in Q16 fixed point: sub-pixel precision with integer math only.
+    _ONE = 1 << 16
+
     def __init__(self, momentum: float = 0.7) -> None:
         self.momentum = min(max(momentum, 0.0), 0.99)
-        self._state: np.ndarray | None = None
+        self._m = int(self.momentum * self._ONE)
+        self._sx: int | None = None
+        self._sy = 0
 
     def update(self, point: Point | None) -> Point | None:
         if point is None:
-            self._state = None
+            self._sx = None
             return None
 
-        vector = np.array(point, dtype=np.float32)
-        if self._state is None:
-            self._state = vector
+        px, py = point
+        if self._sx is None:
+            self._sx, self._sy = px << 16, py << 16
         else:
-            self._state = self.momentum * self._state + (1.0 - self.momentum) * vector
+            m = self._m
+            rest = self._ONE - m
+            self._sx = (m * self._sx + rest * (px << 16)) >> 16
+            self._sy = (m * self._sy + rest * (py << 16)) >> 16
 
-        return int(self._state[0]), int(self._state[1])
+        return self._sx >> 16, self._sy >> 16
 
 
 class GestureFilter: